@@ -3,6 +3,9 @@ import os
 import json
 import re
 import subprocess
+import time
+import heapq
+from bisect import bisect_left
 
 from PySide6.QtWidgets import (
     QApplication,
@@ -10,8 +13,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QLineEdit,
     QPushButton,
     QLabel,
@@ -21,9 +23,92 @@ from PySide6.QtWidgets import (
     QFileDialog,
     QStatusBar,
     QRubberBand,
+    QStyle,
 )
-from PySide6.QtCore import Qt, QTimer, QItemSelectionModel, QRect, QPoint, QSize
-from PySide6.QtGui import QColor, QBrush, QCursor
+from PySide6.QtCore import (
+    Qt,
+    QTimer,
+    QItemSelectionModel,
+    QRect,
+    QPoint,
+    QSize,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    Signal,
+    QAbstractTableModel,
+    QModelIndex,
+    QItemSelection,
+)
+from PySide6.QtGui import QColor, QBrush, QCursor, QKeySequence, QShortcut, QAction
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，未安装时退回标准库 json
+    orjson = None
+
+
+def _json_dumps(obj) -> bytes:
+    """将对象编码为紧凑的 UTF-8 JSON 字节串，优先使用 orjson。"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data):
+    """解析 JSON 文本或字节串，优先使用 orjson。"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _ndjson_dumps(objs) -> bytes:
+    """将对象序列编码为 NDJSON 字节串：每行一个 JSON 对象，以换行结尾。"""
+    return b"".join(_json_dumps(obj) + b"\n" for obj in objs)
+
+
+def _atomic_write(path, data: bytes):
+    """先写临时文件并 fsync，再整体替换目标文件，避免写入中断导致文件损坏。"""
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _append_write(path, data: bytes):
+    """以追加方式写入并 fsync，只写入新增内容而不重写整个文件。"""
+    with open(path, "ab") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _row_runs(rows):
+    """将行号集合按连续区间分组，依次返回 (first, last)。"""
+    first = last = None
+    for row in sorted(rows):
+        if last is not None and row == last + 1:
+            last = row
+            continue
+        if first is not None:
+            yield first, last
+        first = last = row
+    if first is not None:
+        yield first, last
+
+
+def _shift_indices(indices, removed):
+    """删除记录后，把剩余的记录下标前移到新位置（removed 为已删除的下标，升序）。"""
+    return [idx - bisect_left(removed, idx) for idx in indices]
 
 
 class FlowLayout(QLayout):
@@ -40,6 +125,11 @@ class FlowLayout(QLayout):
     def addItem(self, item):
         self._items.append(item)
 
+    def insertWidget(self, index, widget):
+        """在指定位置插入控件：先按 addWidget 追加，再移动到目标位置。"""
+        self.addWidget(widget)
+        self._items.insert(index, self._items.pop())
+
     def count(self):
         return len(self._items)
 
@@ -104,7 +194,464 @@ class FlowLayout(QLayout):
         return y + line_height - rect.y() + m.bottom()
 
 
-class RubberBandTableWidget(QTableWidget):
+class _RecordStore:
+    """以列（平行列表）形式保存素材记录，并维护记录 id 与标签倒排索引。
+
+    筛选与表格展示直接按下标读取各列，避免逐条字典取值；
+    磁盘上仍保存为 list[dict]，只在读写时与列式结构互相转换。
+    """
+
+    _EMPTY_IDS = frozenset()
+    _FILTER_CACHE_MAX = 32  # 最多缓存的标签组合数
+
+    def __init__(self):
+        # 记录 id 单调递增、不会复用；记录新增或变更时都分配新 id，因此兼作版本号
+        self._next_id = 0
+        self.clear()
+
+    def clear(self):
+        self.ids = []
+        self.paths = []
+        self.tags = []  # 每条记录的标签元组，保留输入顺序
+        self.descs = []
+        self.tag_display = []  # 缓存的 "#标签1 #标签2" 展示文本
+        self.tag_index = {}  # tag -> 含该标签的记录 id 集合（倒排索引）
+        # 标签组合 -> (共享的标签元组, 共享的展示文本)；相同组合的记录共用同一对象
+        self._tag_cache = {}
+        # frozenset(选中标签) -> 筛选结果（记录下标元组）；记录有任何增删时整体清空
+        self._filter_cache = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def append(self, path, tags, desc):
+        """追加一条记录，返回分配的记录 id。"""
+        record_id = self._next_id
+        self._next_id += 1
+        tags = tuple(tags)
+        cached = self._tag_cache.get(tags)
+        if cached is None:
+            # 新的标签组合：驻留标签字符串，展示文本只拼接一次："#a #b"
+            tags = tuple(map(sys.intern, tags))
+            cached = (tags, "#" + " #".join(tags) if tags else "")
+            self._tag_cache[tags] = cached
+        tags, display = cached
+        self._filter_cache.clear()
+        self.ids.append(record_id)
+        self.paths.append(path)
+        self.tags.append(tags)
+        self.descs.append(desc)
+        self.tag_display.append(display)
+        tag_index = self.tag_index
+        for t in tags:
+            tag_index.setdefault(t, set()).add(record_id)
+        return record_id
+
+    def extend(self, rows):
+        """批量追加 (path, tags, description) 序列。"""
+        for path, tags, desc in rows:
+            self.append(path, tags, desc)
+
+    def index_of(self, record_id):
+        """返回记录 id 对应的下标。
+
+        id 单调递增且删除不改变相对顺序，因此 ids 始终有序，可二分查找。
+        """
+        return bisect_left(self.ids, record_id)
+
+    def remove(self, record_ids):
+        """删除给定 id 的记录，返回被删除记录原来的下标（升序）。"""
+        indices = sorted(
+            idx
+            for idx in map(self.index_of, set(record_ids))
+            if idx < len(self.ids) and self.ids[idx] in record_ids
+        )
+        if indices:
+            self._filter_cache.clear()
+        # 从大到小删除，避免索引位移
+        for idx in reversed(indices):
+            record_id = self.ids.pop(idx)
+            for t in self.tags.pop(idx):
+                ids = self.tag_index.get(t)
+                if ids is None:
+                    continue
+                ids.discard(record_id)
+                if not ids:
+                    del self.tag_index[t]
+            self.paths.pop(idx)
+            self.descs.pop(idx)
+            self.tag_display.pop(idx)
+        return indices
+
+    def filter_indices(self, selected_tags):
+        """返回同时包含所有选中标签的记录下标元组（按记录顺序，调用方只读）。
+
+        对各标签的倒排列表求交集，从最短的列表开始，
+        开销与命中记录数相关，而与记录总数无关。
+        结果按标签组合缓存，反复切换相同的筛选条件时直接复用。
+        """
+        key = frozenset(selected_tags)
+        cache = self._filter_cache
+        cached = cache.get(key)
+        if cached is None:
+            cached = tuple(self._compute_filter(key))
+            if len(cache) >= self._FILTER_CACHE_MAX:
+                del cache[next(iter(cache))]
+            cache[key] = cached
+        return cached
+
+    def _compute_filter(self, selected_tags):
+        """不经缓存，直接求出同时包含所有选中标签的记录下标。"""
+        if not selected_tags:
+            return range(len(self.ids))
+        tag_index = self.tag_index
+        postings = sorted(
+            (tag_index.get(t, self._EMPTY_IDS) for t in selected_tags), key=len
+        )
+        # 任一标签没有记录时交集必为空，无需再求交
+        if not postings[0]:
+            return []
+        candidates = postings[0].intersection(*postings[1:])
+        # 按 id 排序即为记录原有顺序
+        ids = self.ids
+        return [bisect_left(ids, record_id) for record_id in sorted(candidates)]
+
+    def to_dicts(self, start=0):
+        """转换为用于持久化的 list[dict]；start 指定从哪个下标开始（用于追加保存）。"""
+        return [
+            {"path": path, "tags": list(tags), "description": desc}
+            for path, tags, desc in zip(
+                self.paths[start:], self.tags[start:], self.descs[start:]
+            )
+        ]
+
+
+class _PathCheckSignals(QObject):
+    """后台路径检查结果的回传信号（跨线程时自动排队到主线程）。"""
+
+    checked = Signal(str, bool)
+
+
+class _PathExistsTask(QRunnable):
+    """在线程池中执行 os.path.exists，避免网络盘等慢速磁盘阻塞界面。"""
+
+    def __init__(self, path, signals):
+        super().__init__()
+        self._path = path
+        self._signals = signals
+
+    def run(self):
+        self._signals.checked.emit(self._path, os.path.exists(self._path))
+
+
+class _LoadRecordsSignals(QObject):
+    """后台加载素材数据的回传信号。"""
+
+    chunk = Signal(object)  # 一批已清洗的 (path, tags, description)
+    finished = Signal(int)  # 跳过的无法解析的行数
+    failed = Signal(str)
+
+
+class _LoadRecordsTask(QRunnable):
+    """在线程池中逐行读取 data.ndjson，按批回传清洗后的记录。
+
+    legacy 为 True 时读取旧版 data.json（整个文件为一个 JSON 数组），用于一次性迁移。
+    """
+
+    CHUNK_SIZE = 1000
+
+    def __init__(self, path, normalize, signals, legacy=False):
+        super().__init__()
+        self._path = path
+        self._normalize = normalize
+        self._signals = signals
+        self._legacy = legacy
+        self._skipped = 0
+
+    def run(self):
+        try:
+            with open(self._path, "rb") as f:
+                if self._legacy:
+                    content = f.read().strip()
+                    data = _json_loads(content) if content else []
+                    # 若格式不正确，按空数组处理
+                    items = data if isinstance(data, list) else []
+                else:
+                    items = self._parse_lines(f)
+                chunk = []
+                for row in self._normalize(items):
+                    chunk.append(row)
+                    if len(chunk) >= self.CHUNK_SIZE:
+                        self._signals.chunk.emit(chunk)
+                        chunk = []
+                if chunk:
+                    self._signals.chunk.emit(chunk)
+        except (OSError, ValueError) as e:
+            self._signals.failed.emit(str(e))
+            return
+        self._signals.finished.emit(self._skipped)
+
+    def _parse_lines(self, f):
+        """逐行解析 JSON，跳过空行；无法解析的行（如写入中断留下的半行）计数后跳过。"""
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield _json_loads(line)
+            except ValueError:
+                self._skipped += 1
+
+
+class RecordTableModel(QAbstractTableModel):
+    """素材表格的数据模型，按需从列式存储读取单元格内容。
+
+    视图只为实际绘制的行取数，不再为每条记录创建单元格对象；
+    勾选状态按记录 id 保存，不受排序影响。排序在数据层对行下标完成。
+    """
+
+    HEADERS = ("选择", "路径", "标签", "描述")
+
+    # 共享的画刷与单元格标志，避免在 data()/flags() 中反复构造
+    _BRUSH_MISSING = QBrush(QColor(255, 0, 0))
+    _FLAGS_CHECKABLE = Qt.ItemIsEnabled | Qt.ItemIsUserCheckable | Qt.ItemIsSelectable
+    _FLAGS_RO = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def __init__(self, store, path_exists, parent=None):
+        super().__init__(parent)
+        self._store = store
+        self._path_exists = path_exists  # 查询路径是否存在的回调（可能返回缓存结果）
+        self._rows = []  # 每一行对应的记录下标（已按当前排序列排好）
+        self._checked = set()  # 已勾选记录的 id
+        self._sort_column = -1  # -1 表示按记录原有顺序
+        self._sort_order = Qt.AscendingOrder
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == 0:
+            return self._FLAGS_CHECKABLE
+        return self._FLAGS_RO
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        store = self._store
+        idx = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 1:
+                return store.paths[idx]
+            if column == 2:
+                return store.tag_display[idx]
+            if column == 3:
+                return store.descs[idx]
+        elif role == Qt.CheckStateRole:
+            if column == 0:
+                return Qt.Checked if store.ids[idx] in self._checked else Qt.Unchecked
+        elif role == Qt.ForegroundRole:
+            # 如果文件不存在，用红色文字标记路径
+            if column == 1:
+                path = store.paths[idx]
+                if path and not self._path_exists(path):
+                    return self._BRUSH_MISSING
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or index.column() != 0 or role != Qt.CheckStateRole:
+            return False
+        record_id = self._store.ids[self._rows[index.row()]]
+        if Qt.CheckState(value) == Qt.Checked:
+            self._checked.add(record_id)
+        else:
+            self._checked.discard(record_id)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """按列排序（由表头点击触发），在数据层用 Python 的稳定排序完成。"""
+        self._sort_column = column
+        self._sort_order = order
+        self.layoutAboutToBeChanged.emit()
+        old_rows = self._rows
+        self._rows = self._sorted(old_rows)
+        # 让持久索引（如选择状态）跟随原来的记录移动
+        new_positions = {idx: row for row, idx in enumerate(self._rows)}
+        old_indexes = self.persistentIndexList()
+        new_indexes = [
+            self.index(new_positions[old_rows[index.row()]], index.column())
+            for index in old_indexes
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def _sort_key(self):
+        """返回当前排序列的取值函数；按记录原有顺序排列时返回 None。"""
+        column = self._sort_column
+        store = self._store
+        if column == 0:
+            # 选择列：已勾选的排在前面
+            ids = store.ids
+            checked = self._checked
+
+            def key(idx):
+                return ids[idx] not in checked
+
+            return key
+        if column == 1:
+            return store.paths.__getitem__
+        if column == 2:
+            return store.tag_display.__getitem__
+        if column == 3:
+            return store.descs.__getitem__
+        return None
+
+    def _sorted(self, rows):
+        """返回按当前排序列排好的记录下标列表。"""
+        key = self._sort_key()
+        if key is None:
+            return sorted(rows)
+        return sorted(rows, key=key, reverse=self._sort_order == Qt.DescendingOrder)
+
+    def _insert_position(self, key, value):
+        """二分查找取值为 value 的新行在已排序行中的位置。
+
+        新记录排在取值相同的行之后，与对全部行做稳定排序的结果一致。
+        """
+        rows = self._rows
+        descending = self._sort_order == Qt.DescendingOrder
+        lo, hi = 0, len(rows)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = key(rows[mid])
+            if (value > current) if descending else (value < current):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def set_rows_checked(self, rows, checked):
+        """批量设置若干行的勾选状态，每个连续区间只发出一次 dataChanged。"""
+        ids = self._store.ids
+        record_ids = (ids[self._rows[row]] for row in rows)
+        if checked:
+            self._checked.update(record_ids)
+        else:
+            self._checked.difference_update(record_ids)
+        for first, last in _row_runs(rows):
+            self.dataChanged.emit(
+                self.index(first, 0), self.index(last, 0), [Qt.CheckStateRole]
+            )
+
+    def checked_rows(self):
+        """返回已勾选行的行号集合。"""
+        ids = self._store.ids
+        checked = self._checked
+        return {row for row, idx in enumerate(self._rows) if ids[idx] in checked}
+
+    def append_rows(self, rows):
+        """在末尾追加显示的记录下标（不勾选）。"""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def insert_records(self, indices, checked=False):
+        """插入新追加的记录（下标均大于已有记录），按当前排序放到对应位置。
+
+        checked 为新记录的初始勾选状态，需在计算位置前设置（按选择列排序时会影响位置）。
+        返回插入后这些记录所在的行号（升序）。
+        """
+        if checked:
+            ids = self._store.ids
+            self._checked.update(ids[idx] for idx in indices)
+        key = self._sort_key()
+        if key is None:
+            # 按记录原有顺序时，新记录下标最大，直接追加到末尾
+            first = len(self._rows)
+            self.append_rows(indices)
+            return list(range(first, len(self._rows)))
+        if len(indices) == 1:
+            idx = indices[0]
+            row = self._insert_position(key, key(idx))
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._rows.insert(row, idx)
+            self.endInsertRows()
+            return [row]
+
+        # 批量插入：新记录排好序后与现有行一次归并（相同取值时现有行在前，与稳定排序一致），
+        # 再按插入后的连续区间逐段通知视图
+        descending = self._sort_order == Qt.DescendingOrder
+        merged = list(
+            heapq.merge(
+                self._rows,
+                sorted(indices, key=key, reverse=descending),
+                key=key,
+                reverse=descending,
+            )
+        )
+        first_new = min(indices)  # 新记录下标均大于已有记录
+        rows = [row for row, idx in enumerate(merged) if idx >= first_new]
+        for first, last in _row_runs(rows):
+            self.beginInsertRows(QModelIndex(), first, last)
+            self._rows[first:first] = merged[first : last + 1]
+            self.endInsertRows()
+        return rows
+
+    def remove_records(self, record_ids):
+        """移除这些记录对应的行，需在存储删除记录之前调用。
+
+        每个连续区间发出一次行删除通知，从下往上删除，避免行号位移。
+        """
+        ids = self._store.ids
+        dead_rows = [row for row, idx in enumerate(self._rows) if ids[idx] in record_ids]
+        for first, last in reversed(list(_row_runs(dead_rows))):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first : last + 1]
+            self.endRemoveRows()
+        self._checked.difference_update(record_ids)
+
+    def shift_indices(self, removed):
+        """存储删除记录后，把剩余行的记录下标前移到新位置（显示内容不变，无需通知视图）。"""
+        self._rows = _shift_indices(self._rows, removed)
+
+    def set_rows(self, rows, checked):
+        """替换当前显示的记录下标；checked 为 True 时默认勾选全部行。"""
+        self.beginResetModel()
+        ids = self._store.ids
+        self._checked = {ids[idx] for idx in rows} if checked else set()
+        self._rows = self._sorted(rows)
+        self.endResetModel()
+
+    def checked_indices(self):
+        """返回已勾选行对应的记录下标（按表格显示顺序）。"""
+        ids = self._store.ids
+        checked = self._checked
+        return [idx for idx in self._rows if ids[idx] in checked]
+
+    def notify_paths_changed(self):
+        """路径存在性结果更新后，通知视图重绘路径列。"""
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 1),
+                self.index(len(self._rows) - 1, 1),
+                [Qt.ForegroundRole],
+            )
+
+
+class RubberBandTableView(QTableView):
     """支持橡皮筋框选的表格控件。
 
     在非复选框区域按住左键拖拽可框选行，释放后自动勾选被覆盖的行。
@@ -116,6 +663,9 @@ class RubberBandTableWidget(QTableWidget):
         self._rubber_band = None
         self._origin = None
         self._dragging = False
+        self._checked_rows = set()  # 开始框选时已勾选的行
+        self._checked_selection = QItemSelection()  # 上述行对应的选择区间，开始框选时构建一次
+        self._band_extra = None  # Ctrl 预览时因框选而额外高亮的行；None 表示尚未按 Ctrl 预览
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -135,6 +685,9 @@ class RubberBandTableWidget(QTableWidget):
                 delta = pos - self._origin
                 if delta.manhattanLength() > 5:
                     self._dragging = True
+                    self._checked_rows = self.model().checked_rows()
+                    self._checked_selection = self._rows_selection(self._checked_rows)
+                    self._band_extra = None
                     if self._rubber_band is None:
                         self._rubber_band = QRubberBand(
                             QRubberBand.Rectangle, self.viewport()
@@ -164,58 +717,124 @@ class RubberBandTableWidget(QTableWidget):
         super().mouseReleaseEvent(event)
 
     def _row_visual_rect(self, row):
-        first = self.visualRect(self.model().index(row, 0))
-        last = self.visualRect(self.model().index(row, self.columnCount() - 1))
+        model = self.model()
+        first = self.visualRect(model.index(row, 0))
+        last = self.visualRect(model.index(row, model.columnCount() - 1))
         return first.united(last)
 
+    def _rows_selection(self, rows, selection=None):
+        """把给定的行按连续区间追加到 selection（默认新建）中并返回。"""
+        if selection is None:
+            selection = QItemSelection()
+        model = self.model()
+        last_column = model.columnCount() - 1
+        for first, last in _row_runs(rows):
+            selection.select(model.index(first, 0), model.index(last, last_column))
+        return selection
+
+    def _select_rows(self, rows):
+        """将选择替换为给定的行，连续行合并为一个区间，只调用一次 select。"""
+        sel_model = self.selectionModel()
+        if not sel_model:
+            return
+        sel_model.select(self._rows_selection(rows), QItemSelectionModel.ClearAndSelect)
+
+    def _select_band_with_checked(self, band_rows):
+        """Ctrl 追加模式：在开始框选时构建好的已勾选区间上，只追加框内尚未勾选的行。"""
+        sel_model = self.selectionModel()
+        if not sel_model:
+            return
+        selection = self._rows_selection(
+            band_rows - self._checked_rows, QItemSelection(self._checked_selection)
+        )
+        sel_model.select(selection, QItemSelectionModel.ClearAndSelect)
+
+    def _band_rows(self, rect):
+        """返回与框选矩形相交的行号列表。
+
+        先用 rowAt 按矩形上下边界裁剪出候选行，只对这些行计算 visualRect。
+        """
+        row_count = self.model().rowCount()
+        if row_count == 0:
+            return []
+        first_row = self.rowAt(rect.top())
+        if first_row < 0:
+            # 顶边落在末行之下时不与任何行相交，否则说明顶边在首行之上
+            if rect.top() > self.rowViewportPosition(row_count - 1):
+                return []
+            first_row = 0
+        last_row = self.rowAt(rect.bottom())
+        if last_row < 0:
+            last_row = row_count - 1
+        return [
+            row
+            for row in range(first_row, last_row + 1)
+            if self._row_visual_rect(row).intersects(rect)
+        ]
+
     def _preview_selection(self, rect, modifiers):
         """拖拽过程中实时高亮被框选覆盖的行。"""
         ctrl_held = bool(modifiers & Qt.ControlModifier)
-        sel_model = self.selectionModel()
-        if not sel_model:
+        band_rows = set(self._band_rows(rect))
+        if not ctrl_held:
+            self._band_extra = None
+            self._select_rows(band_rows)
             return
-        sel_model.clearSelection()
-        for row in range(self.rowCount()):
-            row_rect = self._row_visual_rect(row)
-            if row_rect.intersects(rect):
-                self.selectRow(row)
-            elif ctrl_held:
-                check_item = self.item(row, 0)
-                if check_item and check_item.checkState() == Qt.Checked:
-                    self.selectRow(row)
+        extra = band_rows - self._checked_rows
+        sel_model = self.selectionModel()
+        if self._band_extra is None or not sel_model:
+            self._select_band_with_checked(band_rows)
+        else:
+            # 已按 Ctrl 预览过：只增减与上一次相比进出框选范围的行
+            added = extra - self._band_extra
+            if added:
+                sel_model.select(self._rows_selection(added), QItemSelectionModel.Select)
+            left = self._band_extra - extra
+            if left:
+                sel_model.select(self._rows_selection(left), QItemSelectionModel.Deselect)
+        self._band_extra = extra
 
     def _apply_rubber_band_selection(self, rect, modifiers):
-        """框选结束后，根据覆盖范围更新复选框状态并同步行高亮。"""
-        ctrl_held = bool(modifiers & Qt.ControlModifier)
+        """框选结束后，根据覆盖范围更新复选框状态并同步行高亮。
 
-        self.blockSignals(True)
-        for row in range(self.rowCount()):
-            row_rect = self._row_visual_rect(row)
-            check_item = self.item(row, 0)
-            if check_item is None:
-                continue
-            if row_rect.intersects(rect):
-                check_item.setCheckState(Qt.Checked)
-            elif not ctrl_held:
-                check_item.setCheckState(Qt.Unchecked)
-        self.blockSignals(False)
+        与开始框选时已勾选的行求差集，只修改状态真正变化的行。
+        """
+        ctrl_held = bool(modifiers & Qt.ControlModifier)
+        band_rows = set(self._band_rows(rect))
+        to_check = band_rows - self._checked_rows
+        to_uncheck = set() if ctrl_held else self._checked_rows - band_rows
 
-        sel_model = self.selectionModel()
-        if sel_model:
-            sel_model.clearSelection()
-            for row in range(self.rowCount()):
-                check_item = self.item(row, 0)
-                if check_item and check_item.checkState() == Qt.Checked:
-                    self.selectRow(row)
+        # 批量修改期间暂停重绘，结束后统一刷新一次
+        self.setUpdatesEnabled(False)
+        try:
+            model = self.model()
+            model.set_rows_checked(to_check, True)
+            model.set_rows_checked(to_uncheck, False)
+            if ctrl_held:
+                self._select_band_with_checked(band_rows)
+            else:
+                self._select_rows(band_rows)
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 class VideoAssetAssistant(QWidget):
+    # 路径存在性缓存的有效期（秒）与最大条目数
+    EXISTS_CACHE_TTL = 5.0
+    EXISTS_CACHE_MAX = 20000
+
+    # 标签分隔符（空格或逗号）与路径可能的包裹引号
+    _TAG_SPLIT_RE = re.compile(r"[,\s]+")
+    _QUOTE_CHARS = ('"', "'")
+
     def __init__(self):
         super().__init__()
 
         # 使用 exe 同级目录作为数据目录
         self.base_dir = os.path.abspath(os.path.dirname(sys.argv[0]))
-        self.data_path = os.path.join(self.base_dir, "data.json")
+        self.data_path = os.path.join(self.base_dir, "data.ndjson")
+        # 旧版数据文件：data.ndjson 不存在时读取并迁移，原文件保留不动
+        self.legacy_data_path = os.path.join(self.base_dir, "data.json")
         # Everything 文件列表导出路径（.efu）
         self.export_path = os.path.join(self.base_dir, "search_results.efu")
 
@@ -230,91 +849,184 @@ class VideoAssetAssistant(QWidget):
             # 默认指向常见安装路径，真正使用时再做存在性检查
             self.everything_exe_path = candidate2
 
-        self.records = []  # 内存中的素材列表（dict）
+        self._store = _RecordStore()  # 内存中的素材列表（列式存储）
         self.tag_checkboxes = {}  # tag -> QCheckBox
-        self.filtered_record_indices = []  # 当前表格中每一行对应的 self.records 索引
+        self._sorted_tags = []  # 复选框的展示顺序（已排序），用于二分查找插入位置
         self.last_browse_dir = self.base_dir  # 记忆上一次浏览路径所在目录
 
+        # 路径存在性缓存：path -> (检查时间, 是否存在)，按插入顺序淘汰最旧条目
+        self._exists_cache = {}
+        self._pending_path_checks = set()  # 已提交到线程池、尚未返回的路径
+        self._path_update_pending = False  # 是否已安排一次路径列重绘
+        # 信号对象不设 parent，由后台任务持有引用，窗口销毁后回传也不会访问已释放对象
+        self._path_check_signals = _PathCheckSignals()
+        self._path_check_signals.checked.connect(self._on_path_checked)
+
+        # 连续勾选多个标签时合并为一次表格刷新
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self.refresh_table)
+
+        self._loading = False  # 是否正在后台加载素材数据
+        self._migrating = False  # 本次加载的是否为待迁移的旧版 data.json
+        self._columns_sized = False  # 是否已按内容自适应过列宽
+        self._load_signals = _LoadRecordsSignals()
+        self._load_signals.chunk.connect(self._on_records_chunk)
+        self._load_signals.finished.connect(self._on_records_loaded)
+        self._load_signals.failed.connect(self._on_records_load_failed)
+
         self.init_ui()
         self.load_data()
-        self.refresh_tag_filters()
-        self.refresh_table()
 
     # ---------------------- 数据读写 ----------------------
     def load_data(self):
-        """启动时加载 JSON 数据，如果不存在则创建空数组文件。"""
+        """启动时在后台加载 NDJSON 数据（每行一条记录），如果不存在则创建空文件。
+
+        只有旧版 data.json 时先读取它，加载完成后改写为 data.ndjson。
+        窗口先以空表格显示，解析结果分批追加到表格；
+        加载完成前禁用会写入数据文件的操作，避免用不完整的数据覆盖文件。
+        """
+        self._store.clear()
+        self._migrating = False
+        load_path = self.data_path
         if not os.path.exists(self.data_path):
-            # 创建空数组文件
-            try:
-                with open(self.data_path, "w", encoding="utf-8") as f:
-                    json.dump([], f, ensure_ascii=False, indent=2)
-            except OSError as e:
-                QMessageBox.critical(self, "错误", f"无法创建 data.json：\n{e}")
-                self.records = []
-                return
+            if os.path.exists(self.legacy_data_path):
+                self._migrating = True
+                load_path = self.legacy_data_path
+            else:
+                # 创建空文件
+                try:
+                    _atomic_write(self.data_path, b"")
+                except OSError as e:
+                    QMessageBox.critical(self, "错误", f"无法创建 data.ndjson：\n{e}")
+                    return
+
+        self._set_loading(True)
+        QThreadPool.globalInstance().start(
+            _LoadRecordsTask(
+                load_path, self._normalize_records, self._load_signals, self._migrating
+            )
+        )
+
+    def _set_loading(self, loading):
+        """切换加载状态，加载期间禁用新增与删除。"""
+        self._loading = loading
+        self.form_group.setEnabled(not loading)
+        self.delete_button.setEnabled(not loading)
+        if loading:
+            self.status_bar.showMessage("正在加载素材列表...")
+        else:
+            self.status_bar.clearMessage()
 
+    def _on_records_chunk(self, rows):
+        """追加一批后台解析完成的记录（加载期间尚无标签筛选，直接显示）。"""
+        first = len(self._store)
+        self._store.extend(rows)
+        self._model.append_rows(range(first, len(self._store)))
+
+    def _on_records_loaded(self, skipped):
+        self._set_loading(False)
+        self.refresh_tag_filters()
+        self.refresh_table()
+        # 迁移旧版 data.json，或清除无法解析的行：按当前记录整体重写一次
+        if self._migrating or skipped:
+            self._migrating = False
+            self.save_data()
+        if skipped:
+            QMessageBox.warning(
+                self, "警告", f"data.ndjson 中有 {skipped} 行无法解析，已跳过并移除。"
+            )
+
+    def _on_records_load_failed(self, message):
+        self._set_loading(False)
+        # 旧版 data.json 读取失败时保留原文件不动，只新建空的 data.ndjson
+        failed_path = self.legacy_data_path if self._migrating else self.data_path
+        name = os.path.basename(failed_path)
+        self._migrating = False
+        QMessageBox.warning(self, "警告", f"读取 {name} 失败，已重置为空列表：\n{message}")
+        self._store.clear()
         try:
-            with open(self.data_path, "r", encoding="utf-8") as f:
-                content = f.read().strip()
-                if not content:
-                    self.records = []
-                else:
-                    data = json.loads(content)
-                    if isinstance(data, list):
-                        self.records = self._normalize_records(data)
-                    else:
-                        # 若格式不正确，重置为空数组
-                        self.records = []
-        except (OSError, json.JSONDecodeError) as e:
-            QMessageBox.warning(self, "警告", f"读取 data.json 失败，已重置为空数组：\n{e}")
-            self.records = []
-            try:
-                with open(self.data_path, "w", encoding="utf-8") as f:
-                    json.dump([], f, ensure_ascii=False, indent=2)
-            except OSError:
-                pass
+            _atomic_write(self.data_path, b"")
+        except OSError:
+            pass
+        self.refresh_tag_filters()
+        self.refresh_table()
 
     def _normalize_records(self, data):
-        """保证每条记录包含 path/tags/description 三个字段。"""
-        normalized = []
-        for item in data:
-            if not isinstance(item, dict):
-                continue
-            path = self.clean_path(str(item.get("path", "")))
-            tags = item.get("tags", [])
-            if not isinstance(tags, list):
-                tags = []
-            tags = [str(t).strip() for t in tags if str(t).strip()]
-            desc = str(item.get("description", ""))
-            normalized.append(
-                {
-                    "path": path,
-                    "tags": tags,
-                    "description": desc,
-                }
+        """逐条清洗原始记录，生成 (path, tags, description)，保证三个字段齐全。"""
+        fast_clean = self._fast_clean
+        normalize_tags = self._normalize_tags
+        return (
+            (
+                fast_clean(str(item.get("path", ""))),
+                normalize_tags(item.get("tags")),
+                str(item.get("description", "")),
             )
-        return normalized
+            for item in data
+            if isinstance(item, dict)
+        )
+
+    @staticmethod
+    def _normalize_tags(tags):
+        """去除标签首尾空白并丢弃空标签，非列表视为无标签。"""
+        if not isinstance(tags, list):
+            return []
+        return [t for t in (str(x).strip() for x in tags) if t]
+
+    def _split_tags(self, text):
+        """将空格或逗号分隔的标签文本拆分为标签列表。"""
+        return [t for t in self._TAG_SPLIT_RE.split(text) if t] if text else []
 
     def clean_path(self, path: str) -> str:
         """清洗路径字符串，去除首尾空格和包裹引号。"""
         if not isinstance(path, str):
             path = str(path)
+        return self._fast_clean(path)
+
+    @staticmethod
+    def _fast_clean(path: str) -> str:
+        """clean_path 的快速版本，要求传入的已是 str。"""
         cleaned = path.strip()
-        # 去除可能存在的包裹引号
-        if len(cleaned) >= 2 and (
-            (cleaned[0] == '"' and cleaned[-1] == '"')
-            or (cleaned[0] == "'" and cleaned[-1] == "'")
+        # 去除可能存在的包裹引号（首尾为同一种引号）
+        if (
+            len(cleaned) > 1
+            and cleaned[0] == cleaned[-1]
+            and cleaned[0] in VideoAssetAssistant._QUOTE_CHARS
         ):
             cleaned = cleaned[1:-1].strip()
         return cleaned
 
+    def _abs_path(self, path):
+        """清洗路径并转为绝对路径。
+
+        已是绝对路径时只做 normpath，跳过 abspath 内部对当前目录的查询
+        （Windows 上每次都是一次系统调用），批量导入时可明显减少开销。
+        """
+        cleaned = self.clean_path(path)
+        if os.name == "nt":
+            # 盘符路径（C:\ 或 C:/）与 UNC 路径；"\foo" 这类仍需补全当前盘符
+            absolute = cleaned[1:3] in (":\\", ":/") or cleaned.startswith(("\\\\", "//"))
+        else:
+            absolute = cleaned.startswith("/")
+        if absolute:
+            return os.path.normpath(cleaned)
+        return os.path.abspath(cleaned)
+
     def save_data(self):
-        """每次添加后立即覆盖写入 data.json。"""
+        """按当前全部记录整体重写 data.ndjson（一次性编码、原子替换），用于删除与迁移。"""
         try:
-            with open(self.data_path, "w", encoding="utf-8") as f:
-                json.dump(self.records, f, ensure_ascii=False, indent=2)
+            _atomic_write(self.data_path, _ndjson_dumps(self._store.to_dicts()))
         except OSError as e:
-            QMessageBox.critical(self, "错误", f"保存 data.json 失败：\n{e}")
+            QMessageBox.critical(self, "错误", f"保存 data.ndjson 失败：\n{e}")
+
+    def _append_data(self, first):
+        """新增记录后只把下标 first 起的新记录追加到 data.ndjson 末尾。"""
+        try:
+            _append_write(self.data_path, _ndjson_dumps(self._store.to_dicts(first)))
+        except OSError:
+            # 追加失败可能留下半行，改为整体原子重写（仍失败时由 save_data 提示）
+            self.save_data()
 
     # ---------------------- UI 初始化 ----------------------
     def init_ui(self):
@@ -338,15 +1050,24 @@ class VideoAssetAssistant(QWidget):
         filter_layout.addWidget(self.filter_container)
         main_layout.addWidget(filter_group, stretch=0)
 
-        # 中间：表格
-        self.table = RubberBandTableWidget()
-        # 增加一列复选框列用于选择
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["选择", "路径", "标签", "描述"])
+        # 中间：表格（模型按需读取数据，点击表头时由模型自行排序）
+        self._model = RecordTableModel(self._store, self._path_exists, self)
+        self._model.dataChanged.connect(self.on_table_data_changed)
+        self.table = RubberBandTableView()
+        self.table.setModel(self._model)
+        # 初始不排序，保持记录原有顺序
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
         self.table.setSortingEnabled(True)
-        self.table.itemDoubleClicked.connect(self.on_table_item_double_clicked)
-        self.table.itemChanged.connect(self.on_table_item_changed)
+        self.table.doubleClicked.connect(self.on_table_double_clicked)
         self.table.horizontalHeader().setStretchLastSection(True)
+        # 自适应列宽时只测量可见区域的行，不遍历全部记录
+        self.table.horizontalHeader().setResizeContentsPrecision(0)
+
+        # 表头右键菜单：手动自适应列宽（双击表头分隔线可单独调整某一列）
+        fit_columns_action = QAction("自适应列宽", self.table)
+        fit_columns_action.triggered.connect(self.fit_columns)
+        self.table.horizontalHeader().setContextMenuPolicy(Qt.ActionsContextMenu)
+        self.table.horizontalHeader().addAction(fit_columns_action)
 
         main_layout.addWidget(self.table, stretch=3)
 
@@ -362,8 +1083,8 @@ class VideoAssetAssistant(QWidget):
         main_layout.addLayout(export_layout)
 
         # 底部：新增素材表单
-        form_group = QGroupBox("新增素材")
-        form_layout = QVBoxLayout(form_group)
+        self.form_group = QGroupBox("新增素材")
+        form_layout = QVBoxLayout(self.form_group)
 
         # 路径
         path_layout = QHBoxLayout()
@@ -400,12 +1121,16 @@ class VideoAssetAssistant(QWidget):
         button_layout.addWidget(self.add_button)
         form_layout.addLayout(button_layout)
 
-        main_layout.addWidget(form_group, stretch=0)
+        main_layout.addWidget(self.form_group, stretch=0)
 
         # 状态栏，用于显示复制路径等持久化反馈信息
         self.status_bar = QStatusBar()
         main_layout.addWidget(self.status_bar)
 
+        # F5：重新检查表格中所有文件是否存在
+        refresh_shortcut = QShortcut(QKeySequence.Refresh, self)
+        refresh_shortcut.activated.connect(self.recheck_paths)
+
     # ---------------------- 标签筛选区 ----------------------
     def refresh_tag_filters(self):
         """根据当前所有记录中的标签刷新复选框列表。"""
@@ -422,15 +1147,9 @@ class VideoAssetAssistant(QWidget):
 
         self.tag_checkboxes.clear()
 
-        # 统计所有标签
-        all_tags = set()
-        for rec in self.records:
-            for t in rec.get("tags", []):
-                if t:
-                    all_tags.add(t)
-
-        # 排序展示
-        for tag in sorted(all_tags):
+        # 倒排索引的键即为当前所有标签，排序展示
+        self._sorted_tags = sorted(self._store.tag_index)
+        for tag in self._sorted_tags:
             cb = QCheckBox(tag)
             if tag in previously_checked:
                 cb.setChecked(True)
@@ -444,9 +1163,37 @@ class VideoAssetAssistant(QWidget):
             for tag, cb in self.tag_checkboxes.items():
                 cb.setVisible(search_text in tag.lower())
 
+    def _add_tag_checkbox_if_new(self, tag):
+        """新增记录带来新标签时，只创建这一个复选框并插入到排序位置。"""
+        if tag in self.tag_checkboxes:
+            return
+        cb = QCheckBox(tag)
+        cb.stateChanged.connect(self.on_tag_filter_changed)
+        pos = bisect_left(self._sorted_tags, tag)
+        self._sorted_tags.insert(pos, tag)
+        self.filter_container_layout.insertWidget(pos, cb)
+        self.tag_checkboxes[tag] = cb
+
+        # 应用当前搜索过滤
+        search_text = self.tag_search_edit.text().strip().lower()
+        if search_text and search_text not in tag.lower():
+            cb.setVisible(False)
+
+    def _remove_tag_checkbox(self, tag):
+        """移除已不再被任何记录使用的标签复选框，返回它是否处于勾选状态。"""
+        cb = self.tag_checkboxes.pop(tag)
+        del self._sorted_tags[bisect_left(self._sorted_tags, tag)]
+        layout = self.filter_container_layout
+        layout.takeAt(layout.indexOf(cb))
+        layout.invalidate()
+        was_checked = cb.isChecked()
+        cb.deleteLater()
+        return was_checked
+
     def on_tag_filter_changed(self, state):
         _ = state
-        self.refresh_table()
+        # 每次变化都重新开始计时，停止操作 50ms 后才真正刷新
+        self._refresh_timer.start()
 
     def on_tag_search_changed(self, text):
         """根据搜索关键词显示/隐藏标签复选框。"""
@@ -458,89 +1205,117 @@ class VideoAssetAssistant(QWidget):
         return [tag for tag, cb in self.tag_checkboxes.items() if cb.isChecked()]
 
     # ---------------------- 表格展示 ----------------------
-    def get_filtered_records(self):
-        """根据选中的标签返回筛选后的记录列表，并记录对应索引。"""
-        selected_tags = self.get_selected_tags()
-        self.filtered_record_indices = []
-        filtered = []
+    def get_filtered_indices(self):
+        """根据选中的标签返回筛选后的记录下标。"""
+        return self._store.filter_indices(self.get_selected_tags())
 
-        for idx, rec in enumerate(self.records):
-            if not selected_tags:
-                filtered.append(rec)
-                self.filtered_record_indices.append(idx)
-                continue
-            tags = rec.get("tags", [])
-            if all(t in tags for t in selected_tags):
-                filtered.append(rec)
-                self.filtered_record_indices.append(idx)
+    # ---------------------- 文件存在性检查 ----------------------
+    def _path_exists(self, path):
+        """查询路径是否存在，优先使用缓存，缓存缺失或过期时交给后台线程检查。
+
+        尚无结果时返回 True，避免在检查完成前误标红。
+        """
+        cached = self._exists_cache.get(path)
+        if cached is not None and time.monotonic() - cached[0] < self.EXISTS_CACHE_TTL:
+            return cached[1]
+        if path not in self._pending_path_checks:
+            self._pending_path_checks.add(path)
+            QThreadPool.globalInstance().start(
+                _PathExistsTask(path, self._path_check_signals)
+            )
+        return True if cached is None else cached[1]
+
+    def _on_path_checked(self, path, exists):
+        """接收后台检查结果，写入缓存并合并到下一次事件循环统一更新表格。"""
+        self._pending_path_checks.discard(path)
+        self._exists_cache.pop(path, None)
+        self._exists_cache[path] = (time.monotonic(), exists)
+        if len(self._exists_cache) > self.EXISTS_CACHE_MAX:
+            del self._exists_cache[next(iter(self._exists_cache))]
+
+        if not self._path_update_pending:
+            self._path_update_pending = True
+            QTimer.singleShot(0, self._apply_path_check_results)
+
+    def _apply_path_check_results(self):
+        """合并同一轮事件中返回的检查结果，统一通知表格重绘路径列。"""
+        self._path_update_pending = False
+        self._model.notify_paths_changed()
+
+    def recheck_paths(self):
+        """清空存在性缓存，并重新检查表格中当前显示的路径。"""
+        self._exists_cache.clear()
+        # 重绘时模型会为可见行重新发起检查
+        self._model.notify_paths_changed()
 
-        return filtered
+        if hasattr(self, "status_bar") and self.status_bar is not None:
+            self.status_bar.showMessage("正在重新检查文件是否存在...")
+            QTimer.singleShot(3000, self.status_bar.clearMessage)
 
     def refresh_table(self):
         """根据当前筛选结果刷新表格内容。"""
-        # 先根据标签计算筛选结果，并记录映射索引
-        filtered = self.get_filtered_records()
+        filtered = self.get_filtered_indices()
         selected_tags = self.get_selected_tags()
 
-        # 暂时关闭排序，避免刷新时跳动
-        sorting_enabled = self.table.isSortingEnabled()
-        self.table.setSortingEnabled(False)
-
-        # 清空当前选择，避免旧的 selected 状态干扰
-        self.table.clearSelection()
-
-        # 在批量更新单元格时临时阻塞 itemChanged 信号，防止 on_table_item_changed 误触发
-        self.table.blockSignals(True)
-
-        self.table.setRowCount(len(filtered))
-        for row, rec in enumerate(filtered):
-            path = rec.get("path", "")
-            tags = rec.get("tags", [])
-            desc = rec.get("description", "")
+        # 重置模型与选择期间暂停重绘，结束后统一刷新一次
+        self.table.setUpdatesEnabled(False)
+        try:
+            # 清空当前选择，避免旧的 selected 状态干扰
+            self.table.clearSelection()
 
-            # 选择列（复选框）
-            check_item = QTableWidgetItem()
-            check_item.setFlags(
-                Qt.ItemIsEnabled | Qt.ItemIsUserCheckable | Qt.ItemIsSelectable
-            )
             # 如果当前有标签筛选，则默认勾选所有可见项；如果没有筛选，则默认不勾选
+            self._model.set_rows(filtered, checked=bool(selected_tags))
+
+            # 如果当前存在标签筛选，则将所有可见行标记为选中行（与复选框一致）
             if selected_tags:
-                check_item.setCheckState(Qt.Checked)
-            else:
-                check_item.setCheckState(Qt.Unchecked)
+                self.table.selectAll()
+        finally:
+            self.table.setUpdatesEnabled(True)
 
-            # 路径列
-            path_item = QTableWidgetItem(path)
-            path_item.setFlags(path_item.flags() ^ Qt.ItemIsEditable)
+        # 列宽只在首次有数据时自适应一次，之后保留当前宽度
+        if not self._columns_sized and self._model.rowCount():
+            self.fit_columns()
 
-            # 如果文件不存在，用红色文字标记路径
-            if path and not os.path.exists(path):
-                path_item.setForeground(QBrush(QColor("red")))
+    def _append_table_rows(self, indices):
+        """把新追加的记录中符合当前筛选的部分插入表格，不重建已有行。
 
-            # 标签列，显示为 #标签1 #标签2
-            tag_str = " ".join(f"#{t}" for t in tags)
-            tags_item = QTableWidgetItem(tag_str)
-            tags_item.setFlags(tags_item.flags() ^ Qt.ItemIsEditable)
+        有标签筛选时新行默认勾选并高亮，与 refresh_table 的规则一致。
+        返回实际插入表格的记录下标。
+        """
+        selected_tags = self.get_selected_tags()
+        tags = self._store.tags
+        selected = frozenset(selected_tags)
+        matched = [idx for idx in indices if selected.issubset(tags[idx])]
+        if not matched:
+            return matched
+        rows = self._model.insert_records(matched, checked=bool(selected_tags))
+        if selected_tags:
+            # 通知勾选状态，经 on_table_data_changed 同步为行高亮
+            self._model.set_rows_checked(rows, True)
 
-            # 描述列
-            desc_item = QTableWidgetItem(desc)
-            desc_item.setFlags(desc_item.flags() ^ Qt.ItemIsEditable)
+        if not self._columns_sized:
+            self.fit_columns()
+        return matched
 
-            self.table.setItem(row, 0, check_item)
-            self.table.setItem(row, 1, path_item)
-            self.table.setItem(row, 2, tags_item)
-            self.table.setItem(row, 3, desc_item)
+    def fit_columns(self):
+        """按内容自适应所有列宽。"""
+        self.table.resizeColumnsToContents()
+        self._columns_sized = True
 
-        # 恢复信号
-        self.table.blockSignals(False)
+    def _fit_path_column(self, paths):
+        """新增的路径比路径列更宽时，只把路径列加宽到能完整显示这些路径。
 
-        # 如果当前存在标签筛选，则将所有可见行标记为选中行（与复选框一致）
-        if selected_tags:
-            for row in range(self.table.rowCount()):
-                self.table.selectRow(row)
-
-        self.table.resizeColumnsToContents()
-        self.table.setSortingEnabled(sorting_enabled)
+        直接按字体度量计算宽度，新行不在可见区域时同样生效。
+        """
+        metrics = self.table.fontMetrics()
+        widest = max((metrics.horizontalAdvance(p) for p in paths), default=0)
+        # 与单元格绘制时的左右文字边距保持一致
+        margin = (
+            self.table.style().pixelMetric(QStyle.PM_FocusFrameHMargin, None, self.table)
+            + 1
+        ) * 2
+        if widest + margin > self.table.columnWidth(1):
+            self.table.setColumnWidth(1, widest + margin)
 
     # ---------------------- 新增素材 ----------------------
     def add_record(self):
@@ -553,23 +1328,21 @@ class VideoAssetAssistant(QWidget):
             return
 
         # 允许用户输入相对路径，统一转为绝对路径
-        path_cleaned = self.clean_path(path_text)
-        path_abs = os.path.abspath(path_cleaned)
+        path_abs = self._abs_path(path_text)
 
         # 标签用空格或逗号分隔
-        raw_tags = re.split(r"[,\s]+", tags_text) if tags_text else []
-        tags = [t.strip() for t in raw_tags if t.strip()]
-
-        new_record = {
-            "path": path_abs,
-            "tags": tags,
-            "description": desc_text,
-        }
-
-        self.records.append(new_record)
-        self.save_data()
-        self.refresh_tag_filters()
-        self.refresh_table()
+        tags = self._split_tags(tags_text)
+
+        # 新增的路径可能刚刚创建，丢弃旧的存在性缓存
+        self._exists_cache.pop(path_abs, None)
+        self._store.append(path_abs, tags, desc_text)
+        # 先更新界面再保存：保存失败弹窗时表格已与存储一致；只处理新增的这一条
+        for tag in self._store.tags[-1]:
+            self._add_tag_checkbox_if_new(tag)
+        # 只有显示在表格中的路径才需要加宽路径列
+        if self._append_table_rows([len(self._store) - 1]):
+            self._fit_path_column([path_abs])
+        self._append_data(len(self._store) - 1)
 
         # 清空输入框
         self.path_edit.clear()
@@ -582,22 +1355,25 @@ class VideoAssetAssistant(QWidget):
     def export_to_everything(self):
         """生成标准 EFU 文件并调用 Everything 打开。"""
         # 优先使用复选框勾选的行；如果没有勾选，则退回到当前筛选结果的全部行
-        checked_paths = []
-        for row in range(self.table.rowCount()):
-            check_item = self.table.item(row, 0)
-            if check_item and check_item.checkState() == Qt.Checked:
-                path_item = self.table.item(row, 1)
-                if path_item:
-                    p = self.clean_path(path_item.text())
-                    if p:
-                        checked_paths.append(p)
+        store_paths = self._store.paths
+        checked_paths = [
+            p
+            for p in (
+                self.clean_path(store_paths[idx])
+                for idx in self._model.checked_indices()
+            )
+            if p
+        ]
 
         if checked_paths:
             paths = checked_paths
         else:
             # 没有勾选时，使用当前筛选结果的全部记录
-            filtered = self.get_filtered_records()
-            paths = [self.clean_path(rec.get("path", "")) for rec in filtered if rec.get("path", "")]
+            paths = [
+                self.clean_path(store_paths[idx])
+                for idx in self.get_filtered_indices()
+                if store_paths[idx]
+            ]
 
         if not paths:
             QMessageBox.information(self, "提示", "当前筛选结果为空，无法导出。")
@@ -631,17 +1407,13 @@ class VideoAssetAssistant(QWidget):
 
         # 生成标准 EFU 文件（手动写入）
         efu_output = self.export_path
+        # EFU 头 + 每行仅填充 Filename（CSV 规则下引号需双写），整体拼接后一次编码写入
+        lines = ["Filename,Size,Date Modified,Date Created,Attributes\n"]
+        lines.extend('"' + p.replace('"', '""') + '"\n' for p in paths if p)
+        payload = "".join(lines).encode("utf-8")
         try:
-            # 使用 utf-8 编码写入 EFU 文件
-            with open(efu_output, "w", encoding="utf-8") as f:
-                # 写入 EFU 头
-                f.write("Filename,Size,Date Modified,Date Created,Attributes\n")
-                # 每行仅填充 Filename，其余字段留空但保留逗号
-                for p in paths:
-                    if not p:
-                        continue
-                    line = f"\"{p}\"\n"
-                    f.write(line)
+            with open(efu_output, "wb") as f:
+                f.write(payload)
         except OSError as e:
             if hasattr(self, "status_bar") and self.status_bar is not None:
                 self.status_bar.clearMessage()
@@ -668,14 +1440,10 @@ class VideoAssetAssistant(QWidget):
         )
 
     # ---------------------- 交互：双击复制路径 ----------------------
-    def on_table_item_double_clicked(self, item):
+    def on_table_double_clicked(self, index):
         """双击任意单元格，复制该行路径到剪贴板。"""
-        row = item.row()
         # 路径列现在在第 1 列
-        path_item = self.table.item(row, 1)
-        if not path_item:
-            return
-        path_text = path_item.text()
+        path_text = index.sibling(index.row(), 1).data()
         if not path_text:
             return
 
@@ -693,28 +1461,30 @@ class VideoAssetAssistant(QWidget):
             QTimer.singleShot(4000, self.status_bar.clearMessage)
 
     # 当复选框勾选/取消勾选时，同步表格的行选择状态
-    def on_table_item_changed(self, item):
-        if not item:
-            return
+    def on_table_data_changed(self, top_left, bottom_right, roles=()):
         # 只处理“选择”这一列的复选框
-        if item.column() != 0:
+        if top_left.column() != 0:
             return
-        if not (item.flags() & Qt.ItemIsUserCheckable):
+        if roles and Qt.CheckStateRole not in roles:
             return
 
-        row = item.row()
-        if item.checkState() == Qt.Checked:
-            # 勾选时，高亮整行
-            self.table.selectRow(row)
-        else:
-            # 取消勾选时，取消该行的选择状态
-            sel_model = self.table.selectionModel()
-            if sel_model:
-                index = self.table.model().index(row, 0)
-                sel_model.select(
-                    index,
-                    QItemSelectionModel.Deselect | QItemSelectionModel.Rows,
-                )
+        sel_model = self.table.selectionModel()
+        if not sel_model:
+            return
+        # 勾选时高亮整行，取消勾选时取消该行的选择状态；不影响其它行
+        to_select = QItemSelection()
+        to_deselect = QItemSelection()
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            index = self._model.index(row, 0)
+            if index.data(Qt.CheckStateRole) == Qt.Checked:
+                to_select.select(index, index)
+            else:
+                to_deselect.select(index, index)
+        rows_flag = QItemSelectionModel.Rows
+        if not to_select.isEmpty():
+            sel_model.select(to_select, QItemSelectionModel.Select | rows_flag)
+        if not to_deselect.isEmpty():
+            sel_model.select(to_deselect, QItemSelectionModel.Deselect | rows_flag)
 
     # ---------------------- 窗口事件 ----------------------
     def closeEvent(self, event):
@@ -723,13 +1493,10 @@ class VideoAssetAssistant(QWidget):
     # ---------------------- 删除选中素材 ----------------------
     def delete_selected_records(self):
         """根据复选框状态删除表格中选中的素材项。"""
-        rows = []
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.checkState() == Qt.Checked:
-                rows.append(row)
+        record_ids = self._store.ids
+        ids_to_delete = {record_ids[idx] for idx in self._model.checked_indices()}
 
-        if not rows:
+        if not ids_to_delete:
             QMessageBox.information(self, "提示", "请先勾选要删除的素材。")
             return
 
@@ -737,31 +1504,37 @@ class VideoAssetAssistant(QWidget):
         reply = QMessageBox.question(
             self,
             "确认删除",
-            f"确定要删除选中的 {len(rows)} 条素材记录吗？此操作不可撤销。",
+            f"确定要删除选中的 {len(ids_to_delete)} 条素材记录吗？此操作不可撤销。",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No,
         )
         if reply != QMessageBox.Yes:
             return
 
-        # 使用 filtered_record_indices 将表格行映射回 self.records 索引
-        indices_to_delete = []
-        for r in rows:
-            if 0 <= r < len(self.filtered_record_indices):
-                indices_to_delete.append(self.filtered_record_indices[r])
-
-        # 去重并从大到小删除，避免索引位移
-        indices_to_delete = sorted(set(indices_to_delete), reverse=True)
-        for idx in indices_to_delete:
-            if 0 <= idx < len(self.records):
-                self.records.pop(idx)
+        store = self._store
+        affected_tags = {
+            t for idx in map(store.index_of, ids_to_delete) for t in store.tags[idx]
+        }
 
+        # 先更新界面再保存：保存失败弹窗时表格已与存储一致
+        # 模型先移除对应行（此时存储仍完整），存储删除后再把剩余行的下标前移
+        self._model.remove_records(ids_to_delete)
+        removed = store.remove(ids_to_delete)
+        self._model.shift_indices(removed)
+
+        # 只检查被删记录用过的标签，移除已无记录使用的复选框
+        filter_changed = False
+        for tag in affected_tags:
+            if tag not in store.tag_index and tag in self.tag_checkboxes:
+                filter_changed |= self._remove_tag_checkbox(tag)
+        # 被移除的复选框原先处于勾选时，筛选条件变宽，需要按新条件重建表格
+        if filter_changed:
+            self.refresh_table()
         self.save_data()
-        self.refresh_tag_filters()
-        self.refresh_table()
+        deleted_count = len(removed)
 
         if hasattr(self, "status_bar") and self.status_bar is not None:
-            self.status_bar.showMessage(f"已删除 {len(indices_to_delete)} 条素材记录。")
+            self.status_bar.showMessage(f"已删除 {deleted_count} 条素材记录。")
             QTimer.singleShot(4000, self.status_bar.clearMessage)
 
     # ---------------------- 文件浏览 ----------------------
@@ -779,7 +1552,7 @@ class VideoAssetAssistant(QWidget):
         if not file_paths:
             return
         # 始终将第一个文件路径显示在输入框中，方便用户查看 / 手动添加
-        first_path = os.path.abspath(self.clean_path(file_paths[0]))
+        first_path = self._abs_path(file_paths[0])
         # 记住本次浏览的目录，下一次作为起始目录
         self.last_browse_dir = os.path.dirname(first_path) or self.last_browse_dir
         self.path_edit.setText(first_path)
@@ -792,26 +1565,25 @@ class VideoAssetAssistant(QWidget):
         tags_text = self.tags_edit.text().strip()
         desc_text = self.desc_edit.text().strip()
 
-        raw_tags = re.split(r"[,\s]+", tags_text) if tags_text else []
-        tags = [t.strip() for t in raw_tags if t.strip()]
+        tags = self._split_tags(tags_text)
 
-        imported_count = 0
+        first = len(self._store)
         for p in file_paths:
-            path_abs = os.path.abspath(self.clean_path(p))
+            path_abs = self._abs_path(p)
             if not path_abs:
                 continue
-            new_record = {
-                "path": path_abs,
-                "tags": tags,
-                "description": desc_text,
-            }
-            self.records.append(new_record)
-            imported_count += 1
+            self._exists_cache.pop(path_abs, None)
+            self._store.append(path_abs, tags, desc_text)
+        imported_count = len(self._store) - first
 
         if imported_count > 0:
-            self.save_data()
-            self.refresh_tag_filters()
-            self.refresh_table()
+            # 批量导入的记录共用同一组标签，只需检查一次
+            for tag in self._store.tags[-1]:
+                self._add_tag_checkbox_if_new(tag)
+            shown = self._append_table_rows(range(first, len(self._store)))
+            # 只有显示在表格中的路径才需要加宽路径列
+            self._fit_path_column([self._store.paths[idx] for idx in shown])
+            self._append_data(first)
 
         # 在状态栏提示批量导入结果
         if hasattr(self, "status_bar") and self.status_bar is not None: